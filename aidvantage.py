@@ -4,59 +4,149 @@ This module provides a class for scraping data from the Aidvantage website.
 It uses Selenium to interact with the website and Pandas to store the data.
 
 Usage:
-    av = Aidvantage(username, password, ssn, dob)
-    loans = av.get_account_details()
-    transactions = av.get_transactions(loans[list(loans.keys())[0]].name)
-    print(transactions)
+    with Aidvantage(UserLogin(username, password, ssn, dob)) as av:
+        loans = av.get_account_details()
+        transactions = av.get_transactions(loans[list(loans.keys())[0]].name)
+        print(transactions)
 
 Requirements:
     - selenium
     - pandas
+    - lxml
     - requests
     - attrs
+    - pyahocorasick
     - chromedriver (installed and in your PATH)
 
 Example:
-    from aidvantage import Aidvantage
+    from aidvantage import Aidvantage, UserLogin
     from os import environ
 
-    av = Aidvantage(
+    login = UserLogin(
         username=environ["AIDVANTAGE_USER"],
         password=environ["AIDVANTAGE_PASS"],
         ssn=environ["AIDVANTAGE_SSN"],
         dob=environ["AIDVANTAGE_DOB"]
     )
-    loans = av.get_account_details()
-    transactions = av.get_transactions(loans[list(loans.keys())[0]].name)
-    print(transactions)
+    with Aidvantage(login) as av:
+        loans = av.get_account_details()
+        transactions = av.get_transactions(loans[list(loans.keys())[0]].name)
+        print(transactions)
 """
 
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from decimal import Decimal
 from enum import Enum
+from io import StringIO
+
+import ahocorasick
+
+import lxml.html
 
 from attrs import define, field
 
+import pandas
 from pandas import DataFrame
 
 import requests
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.common.exceptions import (
+    NoSuchElementException, TimeoutException, WebDriverException
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions
 
+# Reads a table's body cell text, and optionally its header, in a single WebDriver call.
+# Hidden cells read as '', as Selenium's .text did.
+_TABLE_CELLS_SCRIPT = """
+const [table, includeHeaders] = arguments;
+const visibleText = cell => cell.getClientRects().length > 0 ? cell.innerText.trim() : '';
+const text = (parent, selector) => [...parent.querySelectorAll(selector)].map(visibleText);
+return {
+    headers: includeHeaders ? text(table.querySelector('thead'), 'th') : null,
+    rows: [...table.querySelector('tbody').querySelectorAll('tr')].map(row => text(row, 'td')),
+};
+"""
+
+# Reads the cells under the named headers (spaces removed). Returns null if one is missing.
+# Hidden cells read as '', as Selenium's .text did.
+_TABLE_COLUMNS_SCRIPT = """
+const [table, columns] = arguments;
+const visibleText = cell => cell.getClientRects().length > 0 ? cell.innerText.trim() : '';
+const headers = [...table.querySelector('thead').querySelectorAll('th')]
+    .map(cell => visibleText(cell).replace(/ /g, ''));
+const indexes = columns.map(column => headers.indexOf(column));
+if (indexes.includes(-1)) return null;
+return [...table.querySelector('tbody').querySelectorAll('tr')].map(row => {
+    const cells = row.querySelectorAll('td');
+    return indexes.map(index => visibleText(cells[index]));
+});
+"""
+
+# Decides the login state from page markers, in priority order. Returns null if none match.
+_LOGIN_MARKERS_SCRIPT = """
+// Only rendered links count, as with Selenium's link text lookups.
+const links = new Set(
+    [...document.querySelectorAll('a')]
+        .filter(link => link.getClientRects().length > 0)
+        .map(link => link.innerText.trim())
+);
+// Normal page without login.
+if (links.has('Log in')) return false;
+// Login expired.
+if (links.has('Account Summary')) return true;
+// On the login page, or the additional info page.
+if (document.getElementById('user-id') || document.getElementById('account-number')) return false;
+return null;
+"""
+
+# Returns the first landmark id present on the page, or the page text if there is none.
+_PAGE_LANDMARKS_SCRIPT = """
+const landmark = arguments[0].find(id => document.getElementById(id));
+return landmark ? {landmark} : {text: document.body.innerText};
+"""
+
+# Sets input values by id and fires the events typing would, so page scripts see them.
+_FILL_FIELDS_SCRIPT = """
+for (const [id, value] of Object.entries(arguments[0])) {
+    const input = document.getElementById(id);
+    input.value = value;
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+# Selects the option with the given text and fires change. Returns whether the selection
+# changed, or null if there is no such option.
+_SELECT_BY_TEXT_SCRIPT = """
+const [select, text] = arguments;
+const index = [...select.options].findIndex(option => option.text.trim() === text);
+if (index < 0) return null;
+if (select.selectedIndex === index) return false;
+select.selectedIndex = index;
+select.dispatchEvent(new Event('change', {bubbles: true}));
+return true;
+"""
+
+
+_CURRENCY_STRIP = str.maketrans('', '', '$,')
+_HUNDRED = Decimal(100)
+
 
 def balance_to_float(balance: str) -> Decimal:
     """Converts the Aidvantage balance to a decimal."""
-    return Decimal(balance.lstrip("$").replace(',', ''))
+    return Decimal(balance.translate(_CURRENCY_STRIP))
 
 
 def apr_to_float(apr: str) -> Decimal:
     """Converts the Aidvantage interest rate to a decimal."""
-    return Decimal(float(apr.rstrip("%")) / 100)
+    return Decimal(apr.rstrip("%")) / _HUNDRED
 
 
 @define
@@ -73,6 +163,7 @@ class PageDetail:
     """Data class representing a page within the website."""
     matching_text: str
     link_text: str | None
+    landmark_id: str | None = None
 
 
 @define
@@ -87,54 +178,71 @@ class UserLogin:
 class Aidvantage:
     """Web scraper for the Aidvantage website."""
 
+    # Remote browser sessions kept alive between scrapers. Idle ones are pooled by
+    # service URL; a session in use by a scraper is checked out of the pool.
+    _idle_drivers: dict[str, list[WebDriver]] = {}
+    _shared_drivers: list[WebDriver] = []
+    _pool_lock = threading.Lock()
+
     class CurrentPage(Enum):
         """Various pages within the website."""
         HOME_PAGE = PageDetail("Welcome to Aidvantage!", "")
         GOV_DISCLAIMER = PageDetail(
-            "You are accessing a U.S. Federal Government computer system", None)
-        LOGIN_PAGE = PageDetail("Forgot User ID Forgot Password", "Log in")
+            "You are accessing a U.S. Federal Government computer system", None, "Accept")
+        LOGIN_PAGE = PageDetail("Forgot User ID Forgot Password", "Log in", "user-id")
         ADDITIONAL_INFO = PageDetail(
-            "Please provide the information below so we can verify your account", None)
+            "Please provide the information below so we can verify your account", None,
+            "lblSSN1")
         ACCOUNT_SUMMARY = PageDetail(
             (
                 "This is an attempt to collect a debt and any information obtained will "
                 "be used for that purpose"
             ),
-            "Account Summary")
+            "Account Summary",
+            "divRecentPayments")
         ACCOUNT_HISTORY = PageDetail(
             (
                 "The information contained on this page is current as of the day "
                 "the information is requested"
             ),
-            "Account History"
+            "Account History",
+            "SelctedHistType"
         )
-        LOAN_DETAILS = PageDetail("All Loan Details", "Loan Details")
+        LOAN_DETAILS = PageDetail("All Loan Details", "Loan Details", "tblAllLoanDetails")
         UNKNOWN = PageDetail("Not a known page type.", None)
         EXPIRED = PageDetail("Your session has expired.", None)
 
         @staticmethod
         def get_current_page(driver: WebDriver) -> "Aidvantage.CurrentPage":
             """Gets the current page from the driver."""
-            page_text = driver.find_element(By.TAG_NAME, 'body').text
+            found = driver.execute_script(_PAGE_LANDMARKS_SCRIPT, _LANDMARK_IDS)
+            if "landmark" in found:
+                return _PAGE_LANDMARKS[found["landmark"]]
 
-            for page_choice in Aidvantage.CurrentPage:
-                assert isinstance(page_choice.value, PageDetail)
-                if page_choice.value.matching_text in page_text:
-                    return page_choice
+            # No landmark, fall back to the page text.
+            page_text = found["text"]
 
-            return Aidvantage.CurrentPage.UNKNOWN
+            # One pass over the text; the earliest declared page wins, as before.
+            match = min((hit for _, hit in _PAGE_AUTOMATON.iter(page_text)), default=None)
+            if match is None:
+                return Aidvantage.CurrentPage.UNKNOWN
+            return match[1]
 
         @staticmethod
         def go_to_page(driver: WebDriver, page: "Aidvantage.CurrentPage") -> None:
             """Navigates to the specified page."""
-            if Aidvantage.CurrentPage.get_current_page(driver) == page:
-                return
+            if Aidvantage.CurrentPage.get_current_page(driver) is not page:
+                Aidvantage.CurrentPage.follow_link(driver, page)
+
+        @staticmethod
+        def follow_link(driver: WebDriver, page: "Aidvantage.CurrentPage") -> None:
+            """Clicks the link to the specified page."""
             if page.value.link_text is None:
                 raise ValueError(f"{page} has no link text.")
             driver.find_element(By.PARTIAL_LINK_TEXT, page.value.link_text).click()
 
     def __init__(
-        self, login: UserLogin, driver: WebDriver | None = None
+        self, login: UserLogin, driver: WebDriver | None = None, keep_driver: bool = False
     ) -> None:
         self.__username: str = login.username
         self.__password: str = login.password
@@ -142,25 +250,143 @@ class Aidvantage:
         self.__dob: str = login.dob
         self.home_page = "https://aidvantage.studentaid.gov"
         if driver is None:
-            driver = webdriver.Chrome()
+            driver = webdriver.Chrome(options=self._chrome_options())
         self.driver: WebDriver = driver
+        self._keep_driver = keep_driver
+        self._closed = False
+        # Set by `with_service`; the pool the driver goes back to on close.
+        self._service_url: str | None = None
+        # Lookups fail fast; real synchronization points use explicit waits.
+        self.driver.implicitly_wait(0)
+        self._wait = WebDriverWait(self.driver, 10)  # Wait up to 10 seconds
+        # Last detected page, keyed by the URL it was detected on.
+        self._page_cache: tuple[str, Aidvantage.CurrentPage] | None = None
+        # Table headers by table id; the site's table layouts do not change.
+        self._header_cache: dict[str, list[str]] = {}
+        # Whether the history page already shows "By Loan" for "Life of Loan".
+        self._history_filtered = False
+        # The disclaimer only shows once per session; stop looking after accepting it.
+        self._disclaimer_accepted = False
+        # Plain HTTP client sharing the browser's login, for pages that need no scripting.
+        self._session = requests.Session()
+        # Tables missing from the served HTML; these always use the browser.
+        self._browser_only_tables: set[str] = set()
         # Manual call to get things going.
         self.driver.get(self.home_page)
-        self.driver.implicitly_wait(5)
+        self._session.headers["User-Agent"] = self.driver.execute_script(
+            "return navigator.userAgent"
+        )
 
-    def __del__(self) -> None:
-        """Cleans up the driver."""
-        self.driver.quit()
+    @classmethod
+    def with_service(cls, service_url: str, login: UserLogin) -> "Aidvantage":
+        """Creates a scraper on a browser session of a running ChromeDriver service.
+
+        Sessions are reused by later scrapers for the same service URL within this
+        process, so Chrome is only started once per concurrent scraper. A session
+        is used by one scraper at a time and goes back to the pool on `close`.
+        Sessions are not reused by other processes; they are quit by
+        `quit_shared`, which also runs when the interpreter exits.
+
+        Args:
+            service_url (str): URL of the ChromeDriver service, e.g. "http://localhost:9515".
+            login (UserLogin): The user's login.
+
+        Returns:
+            Aidvantage: A scraper that leaves the session running when it is done.
+        """
+        with cls._pool_lock:
+            idle = cls._idle_drivers.setdefault(service_url, [])
+            driver = idle.pop() if idle else None
+        if driver is None:
+            driver = webdriver.Remote(
+                command_executor=service_url, options=cls._chrome_options()
+            )
+            with cls._pool_lock:
+                cls._shared_drivers.append(driver)
+        scraper = cls(login, driver, keep_driver=True)
+        scraper._service_url = service_url
+        return scraper
+
+    @classmethod
+    def quit_shared(cls) -> None:
+        """Quits every shared browser session created by `with_service`, idle or not."""
+        with cls._pool_lock:
+            drivers = cls._shared_drivers[:]
+            cls._shared_drivers.clear()
+            cls._idle_drivers.clear()
+        for driver in drivers:
+            # The service may already be gone; keep quitting the rest.
+            with suppress(WebDriverException):
+                driver.quit()
+
+    @staticmethod
+    def _chrome_options() -> webdriver.ChromeOptions:
+        """Options for a minimal headless Chrome; scraping only needs the DOM."""
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-dev-shm-usage")
+        # Return once the DOM is ready instead of waiting on every sub-resource.
+        options.page_load_strategy = "eager"
+        return options
+
+    def __enter__(self) -> "Aidvantage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cleans up the driver.
+
+        A kept driver is logged out so the next scraper starts from a clean
+        session; otherwise the browser is quit. Later calls do nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._session.close()
+        if self._keep_driver:
+            self.driver.delete_all_cookies()
+            self.driver.get(self.home_page)
+            self._invalidate_page_cache()
+            if self._service_url is not None:
+                with Aidvantage._pool_lock:
+                    if self.driver in Aidvantage._shared_drivers:
+                        Aidvantage._idle_drivers.setdefault(self._service_url, []).append(
+                            self.driver
+                        )
+        else:
+            self.driver.quit()
+
+    def current_page(self) -> "Aidvantage.CurrentPage":
+        """Gets the current page, reusing the last detection while the URL is unchanged."""
+        url = self.driver.current_url
+        if self._page_cache is not None and self._page_cache[0] == url:
+            return self._page_cache[1]
+
+        page = Aidvantage.CurrentPage.get_current_page(self.driver)
+        self._page_cache = (url, page)
+        return page
 
     def go_to_page(self, page: "Aidvantage.CurrentPage") -> None:
         """Navigates to the specified page."""
-        Aidvantage.CurrentPage.go_to_page(self.driver, page)
+        if self.current_page() is not page:
+            Aidvantage.CurrentPage.follow_link(self.driver, page)
+            self._invalidate_page_cache()
+            self._history_filtered = False
         self._do_filler_steps()
 
     def get_account_balances(self) -> dict[str, Decimal]:
         """Gets the account balances for all loans."""
-        loans = self.get_account_details()
-        return {name: loan.balance for name, loan in loans.items()}
+        self._require_login()
+        self.go_to_page(Aidvantage.CurrentPage.LOAN_DETAILS)
+
+        rows = self._get_table_columns("tblAllLoanDetails", ["Loan", "CurrentBalance"])
+        return {name: balance_to_float(balance) for name, balance in rows}
 
     def get_transactions(self, loan: str) -> DataFrame:
         """Gets the transaction history for a given loan.
@@ -171,53 +397,90 @@ class Aidvantage:
         Returns:
             DataFrame: A DataFrame containing the transaction history.
         """
-        wait = WebDriverWait(self.driver, 10)  # Wait up to 10 seconds
+        self._show_transactions(loan)
+
+        # Parse unpaid principle column from table.
+        return self._get_table_from_page("tblByLoans")
+
+    def get_all_transactions(
+        self, service_url: str | None = None, workers: int = 4
+    ) -> dict[str, DataFrame]:
+        """Gets the transaction history of every loan.
+
+        Args:
+            service_url (str | None): A ChromeDriver service to open extra browser
+                sessions on (see `with_service`). Each session logs in on its own
+                and fetches a share of the loans in parallel. Without it, every
+                loan is fetched in this scraper's browser, one after another.
+            workers (int): The most browser sessions to use with `service_url`.
+
+        Returns:
+            dict[str, DataFrame]: The transaction history by loan name.
+        """
+        loans = list(self.get_account_details())
+        if service_url is None or workers < 2 or len(loans) < 2:
+            return {loan: self.get_transactions(loan) for loan in loans}
+
+        login = UserLogin(self.__username, self.__password, self.__ssn, self.__dob)
+        batches = [loans[index::workers] for index in range(min(workers, len(loans)))]
+
+        def fetch(batch: list[str]) -> dict[str, DataFrame]:
+            with Aidvantage.with_service(service_url, login) as scraper:
+                return {loan: scraper.get_transactions(loan) for loan in batch}
+
+        transactions: dict[str, DataFrame] = {}
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            for batch_transactions in executor.map(fetch, batches):
+                transactions.update(batch_transactions)
+        return {loan: transactions[loan] for loan in loans}
+
+    def _show_transactions(self, loan: str) -> None:
+        """Brings up the account history page filtered to a loan's life-of-loan history."""
+        filters = [
+            ("SelctedHistType", "By Loan"),
+            ("ddl_Loan", loan),
+            ("SelectedDateRange", "Life of Loan"),
+        ]
 
         # Get to the right page.
-        if (
-            Aidvantage.CurrentPage.get_current_page(self.driver)
-            is not Aidvantage.CurrentPage.ACCOUNT_HISTORY
-        ):
+        if self.current_page() is not Aidvantage.CurrentPage.ACCOUNT_HISTORY:
+            self._history_filtered = False
             self._require_login()
             self.go_to_page(Aidvantage.CurrentPage.ACCOUNT_SUMMARY)
 
             # Find recent payments section, then account history.
-            elem = self.driver.find_element(By.ID, "divRecentPayments")
+            elem = self._wait.until(
+                expected_conditions.presence_of_element_located((By.ID, "divRecentPayments"))
+            )
             elem.find_element(By.PARTIAL_LINK_TEXT, "Account History").click()
+            self._invalidate_page_cache()
+        elif self._history_filtered:
+            # Still showing a previous loan's history; only the loan changes.
+            filters = [("ddl_Loan", loan)]
 
         # Display history by Loan.
-        for elem_id, visible_text in [
-            ("SelctedHistType", "By Loan"),
-            ("ddl_Loan", loan),
-            ("SelectedDateRange", "Life of Loan"),
-        ]:
-            elem = self.driver.find_element(By.ID, elem_id)
-            wait.until(expected_conditions.visibility_of_element_located((By.ID, elem_id)))
-            Select(elem).select_by_visible_text(visible_text)
-
-        # Parse unpaid principle column from table.
-        return self._get_table_from_page("tblByLoans")
+        for elem_id, visible_text in filters:
+            self._select_by_text(elem_id, visible_text)
+        self._history_filtered = True
 
     def get_account_details(self) -> dict[str, LoanDetails]:
         """Get the loan details of every loan."""
         self._require_login()
-        Aidvantage.CurrentPage.go_to_page(self.driver, Aidvantage.CurrentPage.LOAN_DETAILS)
 
-        # Get account table.
-        table = self.driver.find_element(By.ID, "tblAllLoanDetails")
+        # Skip the browser if the page serves the table as plain HTML.
+        data = self._fetch_table(Aidvantage.CurrentPage.LOAN_DETAILS, "tblAllLoanDetails")
+        if data is not None:
+            return {row['Loan']: LoanDetails(**row) for row in data.to_dict('records')}
 
-        # Get table header.
-        header_list = []
-        header_elem = table.find_element(By.TAG_NAME, "thead").find_elements(By.TAG_NAME, "th")
-        for item in header_elem:
-            header_list.append(item.text.replace(' ', ''))
+        self.go_to_page(Aidvantage.CurrentPage.LOAN_DETAILS)
+
+        # Get account table.
+        header_list, rows = self._get_table_cells("tblAllLoanDetails")
 
         # Rows
         loans = {}
-        rows = table.find_element(By.TAG_NAME, "tbody").find_elements(By.TAG_NAME, "tr")
-        for row in rows:
+        for data_list in rows:
             # Align headers to columns.
-            data_list = [td.text for td in row.find_elements(By.TAG_NAME, 'td')]
             data_dict = dict(zip(header_list, data_list))
             loans[data_dict['Loan']] = LoanDetails(**data_dict)
 
@@ -225,7 +488,7 @@ class Aidvantage:
 
     def _is_logged_in(self) -> bool:
         """Checks if the user is logged in."""
-        current_page = Aidvantage.CurrentPage.get_current_page(self.driver)
+        current_page = self.current_page()
         if current_page in [
             Aidvantage.CurrentPage.EXPIRED,
             Aidvantage.CurrentPage.LOGIN_PAGE,
@@ -245,93 +508,234 @@ class Aidvantage:
             Aidvantage.CurrentPage.GOV_DISCLAIMER,
             Aidvantage.CurrentPage.ADDITIONAL_INFO,
         ]:
+            # Shown again, so the session must have been reset.
+            self._disclaimer_accepted = False
             self._do_filler_steps()
             return True
 
-        # Normal page without login
-        with suppress(NoSuchElementException):
-            if self.driver.find_element(By.LINK_TEXT, 'Log in'):
-                return False
+        # Probe every login marker in one round-trip.
+        logged_in = self.driver.execute_script(_LOGIN_MARKERS_SCRIPT)
+        if logged_in is None:
+            # No rules match.
+            raise ValueError("Unknown login state.")
+        return logged_in
 
-        # Login expired.
-
-        with suppress(NoSuchElementException):
-            if self.driver.find_element(By.LINK_TEXT, "Account Summary"):
-                return True
-
-        for id_string in [
-            "user-id",          # On the login page.
-            "account-number"    # Additional info page.
+    def _require_login(self):
+        # Last known page is behind the login; nothing to check.
+        if self._page_cache is not None and self._page_cache[1] in [
+            Aidvantage.CurrentPage.ACCOUNT_SUMMARY,
+            Aidvantage.CurrentPage.ACCOUNT_HISTORY,
+            Aidvantage.CurrentPage.LOAN_DETAILS,
         ]:
-            with suppress(NoSuchElementException):
-                if self.driver.find_elements(By.ID, id_string):
-                    return False
-        # No rules match.
-        raise ValueError("Unknown login state.")
+            return
 
-    def _require_login(self):
         if self._is_logged_in():
             return
 
+        # A browser stuck half way through logging in is of no use; don't leak it.
+        try:
+            self._log_in()
+        except Exception:
+            self.close()
+            raise
+
+    def _log_in(self) -> None:
+        """Logs in from a logged-out page."""
         # Go to login page. Link exists on most pages.
         self.go_to_page(Aidvantage.CurrentPage.LOGIN_PAGE)
 
         # Fill-in user/pass.
-        elem = self.driver.find_element(By.ID, 'user-id')
-        elem.send_keys(self.__username)
-        elem = self.driver.find_element(By.ID, 'password')
-        elem.send_keys(self.__password)
+        self._wait.until(
+            expected_conditions.presence_of_element_located((By.ID, 'user-id'))
+        )
+        self._fill_fields({'user-id': self.__username, 'password': self.__password})
 
         # Click login.
         elem = self.driver.find_element(By.ID, 'Submit')
         elem.click()
-
-        if (
-            Aidvantage.CurrentPage.get_current_page(self.driver)
-            is Aidvantage.CurrentPage.ADDITIONAL_INFO
-        ):
-            # Fill-in social-security number.
-            elem = self.driver.find_element(By.ID, "lblSSN1")
-            elem.send_keys(self.__ssn)
-            # Fill-in date of birth.
-            elem = self.driver.find_element(By.ID, 'dob1')
-            elem.send_keys(self.__dob)
+        self._invalidate_page_cache()
+
+        # Either the verification form or the account pages come next.
+        with suppress(TimeoutException):
+            self._wait.until(expected_conditions.any_of(
+                expected_conditions.presence_of_element_located((By.ID, "lblSSN1")),
+                expected_conditions.presence_of_element_located((By.LINK_TEXT, "Account Summary")),
+            ))
+
+        if self.current_page() is Aidvantage.CurrentPage.ADDITIONAL_INFO:
+            # Fill-in social-security number and date of birth.
+            self._fill_fields({"lblSSN1": self.__ssn, 'dob1': self.__dob})
             # Submit
             elem = self.driver.find_element(By.ID, 'Submit')
             elem.click()
+            self._invalidate_page_cache()
+            with suppress(TimeoutException):
+                self._wait.until(expected_conditions.presence_of_element_located(
+                    (By.LINK_TEXT, "Account Summary")
+                ))
 
         # Must be logged in by this point.
         if not self._is_logged_in():
-            raise RuntimeError
+            raise RuntimeError("Login failed.")
+
+    def _select_by_text(self, elem_id: str, text: str) -> None:
+        """Picks a dropdown option by its visible text in one round-trip."""
+        elem = self._wait.until(
+            expected_conditions.element_to_be_clickable((By.ID, elem_id))
+        )
+        changed = self.driver.execute_script(_SELECT_BY_TEXT_SCRIPT, elem, text)
+        if changed is None:
+            raise NoSuchElementException(f"Cannot locate option with visible text: {text}")
+        if changed:
+            # Let the postback replace the page before anything reads it, so a
+            # stale table is never read for the new selection.
+            self._wait.until(
+                expected_conditions.staleness_of(elem),
+                f"{elem_id} was not reloaded after selecting {text!r}.",
+            )
+            self._invalidate_page_cache()
+
+    def _fill_fields(self, values: dict[str, str]) -> None:
+        """Sets the value of each input, by id, in one round-trip."""
+        self.driver.execute_script(_FILL_FIELDS_SCRIPT, values)
 
     def _do_filler_steps(self) -> None:
         """If there was a filler step, do it before returning."""
-        choices = {
-            self.CurrentPage.GOV_DISCLAIMER: self._accept_gov_comp_access,
-        }
-        while (current_page := Aidvantage.CurrentPage.get_current_page(self.driver)) in choices:
-            choices[current_page]()
+        if self._disclaimer_accepted:
+            return
+        # The disclaimer is the only filler step; its button is enough to spot it.
+        while self.driver.find_elements(By.ID, "Accept"):
+            self._accept_gov_comp_access()
 
     def _accept_gov_comp_access(self) -> None:
         accept_button = self.driver.find_element(By.ID, "Accept")
         accept_button.click()
+        self._disclaimer_accepted = True
+        self._invalidate_page_cache()
+
+    def _invalidate_page_cache(self) -> None:
+        """Forgets the last detected page; call after anything that may navigate."""
+        self._page_cache = None
+
+    def _get_table_cells(self, table_id: str) -> tuple[list[str], list[list[str]]]:
+        """Gets the header names and body cell text of a table in one round-trip."""
+        table = self._wait.until(
+            expected_conditions.presence_of_element_located((By.ID, table_id))
+        )
+        header_list = self._header_cache.get(table_id)
+        cells = self.driver.execute_script(_TABLE_CELLS_SCRIPT, table, header_list is None)
+        if header_list is None:
+            header_list = [header.replace(' ', '') for header in cells["headers"]]
+            self._header_cache[table_id] = header_list
+        return header_list, cells["rows"]
+
+    def _get_table_columns(self, table_id: str, columns: list[str]) -> list[list[str]]:
+        """Gets the cell text of only the named columns of a table, row by row."""
+        table = self._wait.until(
+            expected_conditions.presence_of_element_located((By.ID, table_id))
+        )
+        rows = self.driver.execute_script(_TABLE_COLUMNS_SCRIPT, table, columns)
+        if rows is None:
+            raise ValueError(f"{table_id} does not have all of the columns {columns}.")
+        return rows
 
     def _get_table_from_page(self, table_id: str) -> DataFrame:
-        # Get table.
-        table = self.driver.find_element(By.ID, table_id)
+        with suppress(ValueError):
+            return self._parse_table(self._get_table_html(table_id), table_id)
 
-        # Get table header.
-        header_list = []
-        header_elem = table.find_element(By.TAG_NAME, "thead").find_elements(By.TAG_NAME, "th")
-        for item in header_elem:
-            header_list.append(item.text.replace(' ', ''))
+        # Rows padded past the header; realign them one at a time.
+        header_list, rows = self._get_table_cells(table_id)
+        return self._align_rows(header_list, rows)
 
-        # Rows
+    def _get_table_html(self, table_id: str) -> str:
+        """Gets a table's markup from the browser in one round-trip."""
+        table = self._wait.until(
+            expected_conditions.presence_of_element_located((By.ID, table_id))
+        )
+        return self.driver.execute_script("return arguments[0].outerHTML", table)
+
+    def _fetch_table(self, page: "Aidvantage.CurrentPage", table_id: str) -> DataFrame | None:
+        """Downloads a page over HTTP with the browser's cookies and parses a table from it.
+
+        Args:
+            page (Aidvantage.CurrentPage): The page holding the table.
+            table_id (str): The id of the table.
+
+        Returns:
+            DataFrame | None: The table, or None if the browser should be used
+                instead: it is already on the page, or the served HTML does not
+                have the table (e.g. it is built by script).
+        """
+        if table_id in self._browser_only_tables or self.current_page() is page:
+            return None
+        if page.value.link_text is None:
+            raise ValueError(f"{page} has no link text.")
+        url = self.driver.find_element(
+            By.PARTIAL_LINK_TEXT, page.value.link_text
+        ).get_attribute("href")
+        if not url or not url.startswith("http"):
+            self._browser_only_tables.add(table_id)
+            return None
+
+        for cookie in self.driver.get_cookies():
+            self._session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain"), path=cookie.get("path", "/"),
+            )
+
+        try:
+            response = self._session.get(url, timeout=20)
+            response.raise_for_status()
+        except requests.RequestException:
+            return None
+
+        try:
+            return self._parse_table(response.text, table_id)
+        except ValueError:
+            # The page came back without a usable table (e.g. it is built by script).
+            self._browser_only_tables.add(table_id)
+            return None
+
+    @staticmethod
+    def _parse_table(html: str, table_id: str) -> DataFrame:
+        """Parses the table with the given id out of an HTML document.
+
+        Raises:
+            ValueError: If the table is missing, or rows have more cells than the
+                header and must be realigned with `_align_rows`.
+        """
+        try:
+            table = lxml.html.fromstring(html).get_element_by_id(table_id)
+        except KeyError as error:
+            raise ValueError(f"No table with id {table_id}.") from error
+
+        # Keep every cell as its text; pandas needs the column count for that.
+        width = max(
+            (
+                sum(int(cell.get("colspan", 1)) for cell in row.xpath("./th|./td"))
+                for row in table.iter("tr")
+            ),
+            default=0,
+        )
+        data = pandas.read_html(
+            StringIO(html), attrs={"id": table_id}, keep_default_na=False, thousands=None,
+            converters={index: str for index in range(width)},
+        )[0]
+
+        # Columns beyond the header are named "Unnamed: n" by pandas.
+        if any(str(header).startswith("Unnamed:") for header in data.columns):
+            raise ValueError("Columns do not match rows.")
+        data.columns = [str(header).replace(' ', '') for header in data.columns]
+
+        # Drop blank rows.
+        data = data[(data != '').any(axis=1)]
+        return data.reset_index(drop=True)
+
+    @staticmethod
+    def _align_rows(header_list: list[str], rows: list[list[str]]) -> DataFrame:
+        """Builds a table from cell text, dropping padding cells and blank rows."""
         data: dict[str, list] = {header: [] for header in header_list}
-        rows = table.find_element(By.TAG_NAME, "tbody").find_elements(By.TAG_NAME, "tr")
-        for row in rows:
-            # Align headers to columns.
-            data_list = [td.text for td in row.find_elements(By.TAG_NAME, 'td')]
+        for data_list in rows:
             # Align rows to data.
             while len(data_list) > len(header_list):
                 if data_list[0] == '':
@@ -357,3 +761,32 @@ class Aidvantage:
 
         # Process the content in memory
         return response.text
+
+
+atexit.register(Aidvantage.quit_shared)
+
+# Every page's detail, in declaration order, unwrapped from the enum once.
+_PAGE_CHECKS: tuple[tuple[PageDetail, Aidvantage.CurrentPage], ...] = tuple(
+    (page_choice.value, page_choice) for page_choice in Aidvantage.CurrentPage
+)
+assert all(isinstance(detail, PageDetail) for detail, _ in _PAGE_CHECKS)
+
+
+def _build_page_automaton() -> ahocorasick.Automaton:
+    """Builds a matcher for every page's text, valued by (declaration order, page)."""
+    automaton = ahocorasick.Automaton()
+    for order, (detail, page_choice) in enumerate(_PAGE_CHECKS):
+        automaton.add_word(detail.matching_text, (order, page_choice))
+    automaton.make_automaton()
+    return automaton
+
+
+_PAGE_AUTOMATON = _build_page_automaton()
+
+# Pages identified by an element id, in declaration order.
+_PAGE_LANDMARKS = {
+    detail.landmark_id: page_choice
+    for detail, page_choice in _PAGE_CHECKS
+    if detail.landmark_id is not None
+}
+_LANDMARK_IDS = list(_PAGE_LANDMARKS)
@@ -6,14 +6,13 @@ from aidvantage import Aidvantage, UserLogin
 
 
 if __name__ == "__main__":
-    av = Aidvantage(
+    with Aidvantage(
         UserLogin(
             username=environ["AIDVANTAGE_USER"],
             password=environ["AIDVANTAGE_PASS"],
             ssn=environ["AIDVANTAGE_SSN"],
             dob=environ["AIDVANTAGE_DOB"]
         )
-    )
-    loans = av.get_account_details()
-    for loan_name, details in loans.items():
-        pprint(av.get_transactions(loan_name))
+    ) as av:
+        for transactions in av.get_all_transactions().values():
+            pprint(transactions)